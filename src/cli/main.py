@@ -19,7 +19,7 @@ def show_menu():
 
 def main():
     if len(sys.argv) != 2:
-        print(Fore.RED + "Usage: python main.py <pdf_file>" + Style.RESET_ALL)
+        print(Fore.RED + "Usage: python main.py <document_file>" + Style.RESET_ALL)
         return
 
     file_path = sys.argv[1]
@@ -57,6 +57,10 @@ def main():
                     print(Fore.WHITE + "\nContext:" + Style.RESET_ALL)
                     print("-" * 40)
                     print(result['context'])
+                    if result.get('page') is not None:
+                        print(Fore.WHITE + f"Source: {result['source']} (page {result['page']})" + Style.RESET_ALL)
+                    elif result.get('source'):
+                        print(Fore.WHITE + f"Source: {result['source']}" + Style.RESET_ALL)
                     print(Fore.WHITE + f"Score: {result['score']:.4f}" + Style.RESET_ALL)
                     print("-" * 40)
 
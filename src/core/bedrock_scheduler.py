@@ -0,0 +1,413 @@
+# src/core/bedrock_scheduler.py
+# Description: Shared, rate-limit-aware scheduler for all AWS Bedrock calls.
+
+import heapq
+import itertools
+import json
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import (
+    ClientError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError
+)
+from ..config import load_config
+
+_config = load_config()
+
+# Priority lanes: lower value is served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 1
+
+_LANE_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_BULK: "bulk"
+}
+
+RETRYABLE_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailableException",
+    "ModelNotReadyException",
+    "ModelTimeoutException",
+    "InternalServerException"
+}
+
+# Network errors botocore would normally retry itself
+RETRYABLE_CONNECTION_ERRORS = (
+    EndpointConnectionError,
+    ConnectTimeoutError,
+    ReadTimeoutError,
+    ConnectionClosedError
+)
+
+_DEFAULT_SCHEDULER_CONFIG = {
+    "max_retries": 6,
+    "base_backoff": 0.5,
+    "max_backoff": 20.0,
+    "max_concurrency": 4,
+    "limits": {
+        "default": {
+            "requests_per_second": 5,
+            "tokens_per_minute": 100000
+        }
+    }
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate used for token-per-minute accounting"""
+    if not text:
+        return 1
+    return max(1, len(text.encode('utf-8')) // 4)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate"""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (0 if available now)"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_rate
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the service reported throttling"""
+        self._refill()
+        self.tokens = min(self.tokens, 0.0)
+
+
+class _ModelLimiter:
+    """Request and token buckets for a single model"""
+
+    def __init__(self, requests_per_second: float, tokens_per_minute: float):
+        self.requests = TokenBucket(max(1.0, requests_per_second), requests_per_second)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+
+    def time_until(self, tokens: int) -> float:
+        return max(self.requests.time_until(1), self.tokens.time_until(tokens))
+
+    def consume(self, tokens: int) -> None:
+        self.requests.consume(1)
+        self.tokens.consume(tokens)
+
+
+class BedrockScheduler:
+    """Schedules Bedrock invocations across models, lanes and retries
+
+    All callers share one `bedrock-runtime` client. Each model gets its own
+    requests-per-second and tokens-per-minute buckets; pending calls for a
+    model are admitted in priority order (interactive before bulk), and
+    throttling errors are retried with exponential backoff and jitter.
+    """
+
+    def __init__(self, region: str = None, scheduler_config: Dict = None):
+        bedrock_config = _config.get("bedrock", {})
+        scheduler_config = scheduler_config or bedrock_config.get("scheduler", _DEFAULT_SCHEDULER_CONFIG)
+
+        self.max_retries = scheduler_config.get("max_retries", _DEFAULT_SCHEDULER_CONFIG["max_retries"])
+        self.base_backoff = scheduler_config.get("base_backoff", _DEFAULT_SCHEDULER_CONFIG["base_backoff"])
+        self.max_backoff = scheduler_config.get("max_backoff", _DEFAULT_SCHEDULER_CONFIG["max_backoff"])
+        self.max_concurrency = scheduler_config.get(
+            "max_concurrency", _DEFAULT_SCHEDULER_CONFIG["max_concurrency"]
+        )
+        self.limits = scheduler_config.get("limits", _DEFAULT_SCHEDULER_CONFIG["limits"])
+        self._validate_limits()
+
+        # Retries are handled here so they can respect the shared buckets
+        self.client = boto3.client(
+            'bedrock-runtime',
+            region_name=region or bedrock_config["region"],
+            config=Config(
+                retries={"total_max_attempts": 1},
+                max_pool_connections=max(10, self.max_concurrency * 2)
+            )
+        )
+
+        self._cond = threading.Condition()
+        self._pending = []
+        self._sequence = itertools.count()
+        self._limiters = {}
+        self._stats = {
+            "requests": 0,
+            "retries": 0,
+            "throttled": 0,
+            "failures": 0,
+            "total_wait": 0.0,
+            "max_wait": 0.0
+        }
+
+    def _validate_limits(self) -> None:
+        """Reject missing or non-positive quotas before any call is made"""
+        for model_id, limit in self.limits.items():
+            for key in ("requests_per_second", "tokens_per_minute"):
+                value = (limit or {}).get(key)
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                    raise ValueError(
+                        f"bedrock.scheduler.limits['{model_id}'].{key} must be a positive number, "
+                        f"got {value!r}"
+                    )
+
+    def _get_limiter(self, model_id: str) -> _ModelLimiter:
+        if model_id not in self._limiters:
+            limit = self.limits.get(model_id) or self.limits.get("default") \
+                or _DEFAULT_SCHEDULER_CONFIG["limits"]["default"]
+            self._limiters[model_id] = _ModelLimiter(
+                limit["requests_per_second"],
+                limit["tokens_per_minute"]
+            )
+        return self._limiters[model_id]
+
+    def _is_next(self, ticket) -> bool:
+        """True if no earlier ticket for the same model is still pending"""
+        model_id = ticket[2]
+        return min(t for t in self._pending if t[2] == model_id) is ticket
+
+    def _acquire(self, model_id: str, tokens: int, priority: int) -> float:
+        """Block until the model's buckets admit this call; return time waited"""
+        ticket = (priority, next(self._sequence), model_id)
+        started_at = time.monotonic()
+
+        with self._cond:
+            limiter = self._get_limiter(model_id)
+            heapq.heappush(self._pending, ticket)
+            try:
+                while True:
+                    if self._is_next(ticket):
+                        wait = limiter.time_until(tokens)
+                        if wait <= 0:
+                            limiter.consume(tokens)
+                            break
+                        self._cond.wait(timeout=wait)
+                    else:
+                        self._cond.wait()
+            finally:
+                self._pending.remove(ticket)
+                heapq.heapify(self._pending)
+                self._cond.notify_all()
+
+            waited = time.monotonic() - started_at
+            self._stats["requests"] += 1
+            self._stats["total_wait"] += waited
+            self._stats["max_wait"] = max(self._stats["max_wait"], waited)
+        return waited
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.base_backoff * (2 ** attempt)))
+
+    def invoke_model(self,
+                     model_id: str,
+                     body: Dict,
+                     tokens: Optional[int] = None,
+                     priority: int = PRIORITY_BULK) -> Dict:
+        """Invoke a Bedrock model through the shared rate limits
+
+        Args:
+            model_id (str): Bedrock model identifier
+            body (Dict): Request body, serialized to JSON
+            tokens (int): Estimated tokens consumed by the call
+            priority (int): PRIORITY_INTERACTIVE or PRIORITY_BULK
+
+        Returns:
+            Dict: Decoded JSON response body
+        """
+        payload = json.dumps(body)
+        tokens = tokens or estimate_tokens(payload)
+
+        for attempt in range(self.max_retries + 1):
+            self._acquire(model_id, tokens, priority)
+            try:
+                response = self.client.invoke_model(modelId=model_id, body=payload)
+                return json.loads(response['body'].read())
+            except (ClientError, *RETRYABLE_CONNECTION_ERRORS) as e:
+                code = e.response.get("Error", {}).get("Code") if isinstance(e, ClientError) else None
+                retryable = code in RETRYABLE_ERROR_CODES or isinstance(e, RETRYABLE_CONNECTION_ERRORS)
+                if not retryable or attempt == self.max_retries:
+                    with self._cond:
+                        self._stats["failures"] += 1
+                    raise
+                with self._cond:
+                    self._stats["retries"] += 1
+                    if code in ("ThrottlingException", "TooManyRequestsException"):
+                        self._stats["throttled"] += 1
+                        self._get_limiter(model_id).requests.drain()
+                time.sleep(self._backoff(attempt))
+
+    def stats(self) -> Dict:
+        """Snapshot of queue depth per lane and wait/retry counters"""
+        with self._cond:
+            queue_depth = {name: 0 for name in _LANE_NAMES.values()}
+            for priority, _, _ in self._pending:
+                lane = _LANE_NAMES.get(priority, str(priority))
+                queue_depth[lane] = queue_depth.get(lane, 0) + 1
+
+            stats = dict(self._stats)
+            stats["queue_depth"] = queue_depth
+            stats["avg_wait"] = stats["total_wait"] / stats["requests"] if stats["requests"] else 0.0
+            return stats
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> BedrockScheduler:
+    """Return the process-wide Bedrock scheduler"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = BedrockScheduler()
+        return _scheduler
+
+
+# Test code
+if __name__ == "__main__":
+    import io
+
+    class _StubClient:
+        """Stands in for bedrock-runtime; fails with queued errors, then succeeds"""
+
+        def __init__(self):
+            self.calls = []
+            self.errors = []
+            self.lock = threading.Lock()
+
+        def invoke_model(self, modelId, body):
+            with self.lock:
+                self.calls.append((modelId, json.loads(body)))
+                error = self.errors.pop(0) if self.errors else None
+            if error is not None:
+                raise error
+            return {"body": io.BytesIO(json.dumps({"ok": True}).encode('utf-8'))}
+
+    def throttling_error():
+        return ClientError({"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+                           "InvokeModel")
+
+    def run_tests():
+        print("\n=== Running Bedrock Scheduler Tests ===\n")
+
+        try:
+            scheduler = BedrockScheduler(region="us-west-2", scheduler_config={
+                "max_retries": 2,
+                "base_backoff": 0.01,
+                "max_backoff": 0.05,
+                "max_concurrency": 4,
+                "limits": {
+                    "pacing-model": {"requests_per_second": 20, "tokens_per_minute": 10 ** 9},
+                    "default": {"requests_per_second": 5, "tokens_per_minute": 10 ** 9}
+                }
+            })
+            stub = _StubClient()
+            scheduler.client = stub
+            print("1. Scheduler initialized with stub client")
+
+            # Pacing: 20 rps with a burst of 20, so 30 calls need ~0.5s
+            print("\n2. Testing pacing at configured rate...")
+            started_at = time.monotonic()
+            threads = [threading.Thread(target=scheduler.invoke_model,
+                                        args=("pacing-model", {"i": i}))
+                       for i in range(30)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.monotonic() - started_at
+            assert len(stub.calls) == 30
+            assert 0.45 <= elapsed < 1.5, f"30 calls at 20 rps took {elapsed:.2f}s"
+            print(f"   ✓ 30 calls took {elapsed:.2f}s (expected ~0.5s)")
+
+            # Ordering: bulk calls queue behind an empty bucket, then an
+            # interactive call arrives and must be admitted first
+            print("\n3. Testing interactive-before-bulk ordering...")
+            stub.calls.clear()
+            scheduler._get_limiter("order-model").requests.drain()
+            bulk = [threading.Thread(target=scheduler.invoke_model,
+                                     args=("order-model", {"lane": "bulk"}, 1, PRIORITY_BULK))
+                    for _ in range(3)]
+            for thread in bulk:
+                thread.start()
+            time.sleep(0.05)
+            assert scheduler.stats()["queue_depth"]["bulk"] == 3
+            interactive = threading.Thread(target=scheduler.invoke_model,
+                                           args=("order-model", {"lane": "interactive"},
+                                                 1, PRIORITY_INTERACTIVE))
+            interactive.start()
+            for thread in bulk + [interactive]:
+                thread.join()
+            lanes = [body["lane"] for _, body in stub.calls]
+            assert lanes == ["interactive", "bulk", "bulk", "bulk"], lanes
+            print(f"   ✓ Admission order: {lanes}")
+
+            # Retry: two throttles then success
+            print("\n4. Testing retry on ThrottlingException...")
+            stub.calls.clear()
+            retries_before = scheduler.stats()["retries"]
+            stub.errors = [throttling_error(), throttling_error()]
+            assert scheduler.invoke_model("retry-model", {"q": 1}) == {"ok": True}
+            assert len(stub.calls) == 3
+            assert scheduler.stats()["retries"] - retries_before == 2
+            print("   ✓ Succeeded after 2 retries")
+
+            print("\nTesting retry on connection error:")
+            stub.calls.clear()
+            stub.errors = [EndpointConnectionError(endpoint_url="https://bedrock-runtime")]
+            assert scheduler.invoke_model("retry-model", {"q": 2}) == {"ok": True}
+            assert len(stub.calls) == 2
+            print("   ✓ Succeeded after connection error")
+
+            # Give up once max_retries is exhausted
+            print("\n5. Testing give-up after max retries...")
+            stub.calls.clear()
+            failures_before = scheduler.stats()["failures"]
+            stub.errors = [throttling_error() for _ in range(3)]
+            try:
+                scheduler.invoke_model("retry-model", {"q": 3})
+                assert False, "Should have raised after max retries"
+            except ClientError as e:
+                assert e.response["Error"]["Code"] == "ThrottlingException"
+            assert len(stub.calls) == 3
+            assert scheduler.stats()["failures"] - failures_before == 1
+            print("   ✓ Raised ThrottlingException after 3 attempts")
+
+            print("\n6. Testing limit validation...")
+            try:
+                BedrockScheduler(region="us-west-2", scheduler_config={
+                    "limits": {"default": {"requests_per_second": 0, "tokens_per_minute": 1000}}
+                })
+                assert False, "Should have rejected a zero limit"
+            except ValueError as e:
+                print(f"   ✓ Invalid limit properly handled: {str(e)}")
+
+            print("\n✓ All tests passed successfully!")
+
+        except Exception as e:
+            print(f"\n✘ Test failed: {str(e)}")
+            raise e
+
+
+    run_tests()
@@ -1,6 +1,6 @@
 # core/chunker.py
 
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator
 import os.path as osp
 from ..config import load_config
 
@@ -47,3 +47,26 @@ class TextChunker:
                 start_pos = end_pos
 
         return chunks
+
+    def chunk_sections(self, sections: Iterable[Dict]) -> Iterator[Dict]:
+        """Lazily chunk page / section records from a document loader
+
+        Chunks never span sections, so each chunk carries the page/section
+        metadata of its source, and positions are document-level offsets.
+        """
+        chunk_id = 0
+        for section in sections:
+            section_meta = section["metadata"]
+            for chunk in self.chunk_text(section["text"]):
+                metadata = chunk["metadata"]
+                metadata.update({
+                    "chunk_id": str(chunk_id),
+                    "start_pos": section_meta["start_pos"] + metadata["start_pos"],
+                    "end_pos": section_meta["start_pos"] + metadata["end_pos"],
+                    "source": section_meta["source"],
+                    "section": section_meta["section"],
+                    "page": section_meta["page"],
+                    "title": section_meta["title"]
+                })
+                chunk_id += 1
+                yield chunk
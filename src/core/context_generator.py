@@ -1,19 +1,16 @@
 # src/context_generator.py
 # Description: Context generator using AWS Bedrock Claude model.
 
-import json
-import boto3
+from typing import Optional
 from ..config import load_config
+from .bedrock_scheduler import get_scheduler, estimate_tokens, PRIORITY_BULK
 
 _config = load_config()
 
 class ContextGenerator:
     def __init__(self):
-        """Initialize context generator with Bedrock client"""
-        self.client = boto3.client(
-            'bedrock-runtime',
-            region_name=_config["bedrock"]["region"]
-        )
+        """Initialize context generator with the shared Bedrock scheduler"""
+        self.scheduler = get_scheduler()
         self.model_id = _config["bedrock"]["llm"]["model_id"]
         self.max_tokens = _config["bedrock"]["llm"]["max_tokens"]
         self.temperature = _config["bedrock"]["llm"]["temperature"]
@@ -25,12 +22,13 @@ class ContextGenerator:
         """Clean text by handling encoding issues"""
         return text.encode('utf-8', 'ignore').decode('utf-8')
 
-    def get_context_for_chunk(self, full_doc: str, chunk: str) -> str:
+    def get_context_for_chunk(self, full_doc: str, chunk: str, start_pos: Optional[int] = None) -> str:
         """Get context for a chunk based on configuration method
 
         Args:
             full_doc (str): Full document text
             chunk (str): Chunk to get context for
+            start_pos (int): Chunk offset in the document, if known
 
         Returns:
             str: Context for the chunk (full doc or window)
@@ -38,8 +36,12 @@ class ContextGenerator:
         if self.context_method == "full":
             return full_doc
 
-        # Window method
-        chunk_start = full_doc.find(chunk)
+        # Window method; prefer the known offset so repeated text such as
+        # page headers does not resolve to its first occurrence
+        if start_pos is not None and 0 <= start_pos < len(full_doc):
+            chunk_start = start_pos
+        else:
+            chunk_start = full_doc.find(chunk)
         if chunk_start == -1:
             return full_doc
 
@@ -47,12 +49,18 @@ class ContextGenerator:
         end = min(len(full_doc), chunk_start + len(chunk) + self.context_window)
         return full_doc[start:end]
 
-    def generate_context(self, full_doc: str, chunk: str) -> str:
+    def generate_context(self,
+                         full_doc: str,
+                         chunk: str,
+                         priority: int = PRIORITY_BULK,
+                         start_pos: Optional[int] = None) -> str:
         """Generate context for a chunk using Bedrock Claude
 
         Args:
             full_doc (str): Full document content
             chunk (str): The chunk to generate context for
+            priority (int): Scheduler lane for the request
+            start_pos (int): Chunk offset in the document, if known
 
         Returns:
             str: Generated context
@@ -60,7 +68,7 @@ class ContextGenerator:
         if not full_doc or not chunk:
             raise ValueError("Full document and chunk must not be empty")
 
-        context = self.get_context_for_chunk(full_doc, chunk)
+        context = self.get_context_for_chunk(full_doc, chunk, start_pos)
 
         prompt = f"""Here is a section from a document, with its context:
 
@@ -74,9 +82,9 @@ Please provide a brief context that situates this specific section within the br
 Answer only with the succinct context, nothing else."""
 
         try:
-            response = self.client.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps({
+            response_body = self.scheduler.invoke_model(
+                self.model_id,
+                {
                     "anthropic_version": "bedrock-2023-05-31",
                     "messages": [{
                         "role": "user",
@@ -84,10 +92,11 @@ Answer only with the succinct context, nothing else."""
                     }],
                     "max_tokens": self.max_tokens,
                     "temperature": self.temperature
-                })
+                },
+                tokens=estimate_tokens(prompt) + self.max_tokens,
+                priority=priority
             )
 
-            response_body = json.loads(response['body'].read())
             return self.clean_text(response_body['content'][0]['text'])
 
         except Exception as e:
@@ -156,6 +165,13 @@ if __name__ == "__main__":
             assert context == full_doc
             print("   ✓ Missing chunk properly handled")
 
+            print("\nTesting window at known chunk offset:")
+            repeated_doc = "머리글\n" + "가" * 3000 + "\n머리글\n" + "나" * 3000
+            second = repeated_doc.rfind("머리글")
+            context = generator.get_context_for_chunk(repeated_doc, "머리글", second)
+            assert "나" in context and context.startswith("가")
+            print("   ✓ Repeated text uses the given offset")
+
             print("\n✓ All tests passed successfully!")
 
         except Exception as e:
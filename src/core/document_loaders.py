@@ -0,0 +1,270 @@
+# src/core/document_loaders.py
+# Description: File-type loader registry yielding page / section records lazily.
+
+import os.path as osp
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import PyPDF2
+from ..config import load_config
+
+_config = load_config()
+
+_LOADERS: Dict[str, Callable[[str], Iterator[Dict]]] = {}
+
+_MARKDOWN_HEADING = re.compile(r'^\s{0,3}(#{1,6})\s+(.*?)\s*#*\s*$')
+_MARKDOWN_FENCE = re.compile(r'^\s{0,3}(`{3,}|~{3,})')
+_HTML_READ_SIZE = 64 * 1024
+
+
+def _max_section_size() -> int:
+    return _config.get("document", {}).get("max_section_size", 20000)
+
+
+def register_loader(*extensions: str):
+    """Register a loader function for one or more file extensions"""
+    def decorator(func):
+        for ext in extensions:
+            _LOADERS[ext.lower().lstrip('.')] = func
+        return func
+    return decorator
+
+
+def get_loader(file_path: str) -> Callable[[str], Iterator[Dict]]:
+    """Return the loader registered for the file's extension"""
+    ext = osp.splitext(file_path)[1].lower().lstrip('.')
+    if ext not in _LOADERS:
+        raise ValueError(
+            f"Unsupported file type: '{ext or file_path}'. "
+            f"Supported types: {', '.join(sorted(_LOADERS))}"
+        )
+    return _LOADERS[ext]
+
+
+def supported_extensions() -> List[str]:
+    return sorted(_LOADERS)
+
+
+def load_document(file_path: str) -> Iterator[Dict]:
+    """Lazily yield section records for a document
+
+    Each record has the form::
+
+        {"text": str,
+         "metadata": {"source": str, "section": int, "page": int | None,
+                      "title": str | None, "start_pos": int, "end_pos": int}}
+
+    `start_pos` / `end_pos` are offsets into the document text formed by
+    joining all sections with a trailing newline each.
+
+    Args:
+        file_path (str): Path to the document
+
+    Yields:
+        Dict: Section record
+    """
+    loader = get_loader(file_path)
+    offset = 0
+    section_id = 0
+    for section in loader(file_path):
+        text = section["text"]
+        if not text.strip():
+            continue
+        yield {
+            "text": text,
+            "metadata": {
+                "source": osp.basename(file_path),
+                "section": section_id,
+                "page": section.get("page"),
+                "title": section.get("title"),
+                "start_pos": offset,
+                "end_pos": offset + len(text)
+            }
+        }
+        offset += len(text) + 1
+        section_id += 1
+
+
+def _split_lines(lines: Iterable[Tuple[str, Optional[str]]]) -> Iterator[Dict]:
+    """Group (line, heading) pairs into sections at headings, capped at the max section size"""
+    max_size = _max_section_size()
+    buffer = []
+    size = 0
+    title = None
+
+    for line, heading in lines:
+        # Over-long lines (e.g. long DOCX paragraphs) are cut at the cap
+        for start in range(0, max(len(line), 1), max_size):
+            piece = line[start:start + max_size]
+            if buffer and (heading is not None or size + len(piece) > max_size):
+                yield {"text": ''.join(buffer).strip('\n'), "title": title}
+                buffer, size = [], 0
+            if heading is not None:
+                title = heading
+                heading = None
+            buffer.append(piece)
+            size += len(piece)
+
+    if buffer:
+        yield {"text": ''.join(buffer).strip('\n'), "title": title}
+
+
+def _read_lines(file, max_size: int) -> Iterator[Tuple[str, bool]]:
+    """Yield (piece, at_line_start) pairs, never reading more than `max_size` characters at once"""
+    at_line_start = True
+    while True:
+        piece = file.readline(max_size)
+        if not piece:
+            break
+        yield piece, at_line_start
+        at_line_start = piece.endswith('\n')
+
+
+@register_loader('pdf')
+def load_pdf(file_path: str) -> Iterator[Dict]:
+    """Yield one record per PDF page"""
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page_number, page in enumerate(pdf_reader.pages, 1):
+            yield {"text": page.extract_text() or '', "page": page_number}
+
+
+@register_loader('txt', 'text')
+def load_text(file_path: str) -> Iterator[Dict]:
+    """Yield plain text in line-aligned sections"""
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
+        yield from _split_lines((line, None) for line, _ in _read_lines(file, _max_section_size()))
+
+
+@register_loader('md', 'markdown')
+def load_markdown(file_path: str) -> Iterator[Dict]:
+    """Yield one record per Markdown heading section"""
+    def lines(file):
+        fence = None
+        for line, at_line_start in _read_lines(file, _max_section_size()):
+            if not at_line_start:
+                yield line, None
+                continue
+            # Headings are only recognized outside ``` / ~~~ code blocks
+            fence_match = _MARKDOWN_FENCE.match(line)
+            if fence_match:
+                marker = fence_match.group(1)
+                if fence is None:
+                    fence = marker
+                elif marker[0] == fence[0] and len(marker) >= len(fence) and not line.strip()[len(marker):]:
+                    fence = None
+                yield line, None
+                continue
+            match = _MARKDOWN_HEADING.match(line) if fence is None else None
+            yield line, match.group(2) if match else None
+
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
+        yield from _split_lines(lines(file))
+
+
+@register_loader('docx')
+def load_docx(file_path: str) -> Iterator[Dict]:
+    """Yield one record per Word heading section, including table text"""
+    try:
+        import docx
+        from docx.table import Table
+        from docx.text.paragraph import Paragraph
+    except ImportError:
+        raise ImportError("python-docx is required to read .docx files: pip install python-docx")
+
+    def table_rows(table):
+        for row in table.rows:
+            cells = []
+            for cell in row.cells:
+                # Merged cells are repeated per grid column; keep one copy
+                if cells and cell._tc is cells[-1]._tc:
+                    continue
+                cells.append(cell)
+            text = ' | '.join(' '.join(cell.text.split()) for cell in cells)
+            if text.strip(' |'):
+                yield text + '\n', None
+
+    def lines():
+        document = docx.Document(file_path)
+        # Walk paragraphs and tables in document order
+        for element in document.element.body.iterchildren():
+            if element.tag.endswith('}tbl'):
+                yield from table_rows(Table(element, document))
+            elif element.tag.endswith('}p'):
+                paragraph = Paragraph(element, document)
+                style = paragraph.style.name if paragraph.style is not None else ''
+                is_heading = style.startswith('Heading') or style == 'Title'
+                yield paragraph.text + '\n', paragraph.text.strip() if is_heading else None
+
+    yield from _split_lines(lines())
+
+
+class _HTMLSectionParser(HTMLParser):
+    """Collects visible HTML text, starting a new section at each heading"""
+
+    HEADINGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+    BLOCKS = HEADINGS | {'p', 'div', 'br', 'li', 'tr', 'section', 'article', 'pre', 'blockquote'}
+    SKIP = {'script', 'style', 'head', 'noscript'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.sections = []
+        self._parts = []
+        self._size = 0
+        self._title = None
+        self._heading = None
+        self._skip_depth = 0
+
+    def _flush(self):
+        text = re.sub(r'\n{3,}', '\n\n', ''.join(self._parts)).strip()
+        if text:
+            self.sections.append({"text": text, "title": self._title})
+        self._parts, self._size = [], 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP:
+            self._skip_depth += 1
+        elif tag in self.HEADINGS:
+            self._flush()
+            self._heading = []
+        if tag in self.BLOCKS:
+            self._parts.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in self.HEADINGS and self._heading is not None:
+            self._title = ' '.join(''.join(self._heading).split()) or self._title
+            self._heading = None
+        if tag in self.BLOCKS:
+            self._parts.append('\n')
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if self._heading is not None:
+            self._heading.append(data)
+        self._parts.append(data)
+        self._size += len(data)
+        if self._size > _max_section_size() and self._heading is None:
+            self._flush()
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+@register_loader('html', 'htm')
+def load_html(file_path: str) -> Iterator[Dict]:
+    """Yield one record per HTML heading section, parsing incrementally"""
+    parser = _HTMLSectionParser()
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
+        while True:
+            data = file.read(_HTML_READ_SIZE)
+            if not data:
+                break
+            parser.feed(data)
+            while parser.sections:
+                yield parser.sections.pop(0)
+    parser.close()
+    yield from parser.sections
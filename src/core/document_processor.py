@@ -3,36 +3,17 @@
 
 import sys
 import os
-import PyPDF2
 from src.core.chunker import TextChunker
+from src.core.document_loaders import load_document
 from src.core.context_generator import ContextGenerator
 from src.core.opensearch_client import OpenSearchHandler
 from src.core.embedding_models import get_embedding_model
-
-
-def read_pdf(file_path: str) -> str:
-    """Read text from PDF file"""
-    try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ''
-            for page in pdf_reader.pages:
-                text += page.extract_text() + '\n'
-            return text
-    except Exception as e:
-        print(f"Error reading PDF file: {str(e)}")
-        return None
+from src.core.bedrock_scheduler import get_scheduler
 
 
 def process_document(file_path: str) -> bool:
     """Process document and store in OpenSearch"""
     try:
-        # Read document
-        print("\nReading document...")
-        text = read_pdf(file_path)
-        if not text:
-            return False
-
         # Initialize components
         print("Initializing components...")
         chunker = TextChunker()
@@ -40,21 +21,38 @@ def process_document(file_path: str) -> bool:
         opensearch = OpenSearchHandler()
         embedding_model = get_embedding_model()
 
-        # Create chunks
-        print("\nChunking text...")
-        chunks = chunker.chunk_text(text)
-        print(f"Created {len(chunks)} chunks")
+        # Read and chunk document section by section
+        print("\nReading and chunking document...")
+        doc_parts = []
+
+        def collect(sections):
+            # Context generation still needs the document text
+            for section in sections:
+                doc_parts.append(section["text"] + '\n')
+                yield section
+
+        chunks = list(chunker.chunk_sections(collect(load_document(file_path))))
+        text = ''.join(doc_parts)
+        if not chunks:
+            print("No text found in document")
+            return False
+        print(f"Read {len(doc_parts)} sections, created {len(chunks)} chunks")
 
         # Index documents
         print("\nIndexing documents...")
         opensearch.create_index(recreate=True)  # Reset index
         opensearch.index_documents(
-            [chunk["text"] for chunk in chunks],
+            chunks,
             text,
             context_gen,
             embedding_model
         )
 
+        stats = get_scheduler().stats()
+        print(f"Bedrock requests: {stats['requests']}, retries: {stats['retries']} "
+              f"(throttled: {stats['throttled']}), "
+              f"avg wait: {stats['avg_wait']:.2f}s, max wait: {stats['max_wait']:.2f}s")
+
         return True
 
     except Exception as e:
@@ -91,7 +89,7 @@ def show_menu() -> None:
 
 def main():
     if len(sys.argv) != 2:
-        print("Usage: python document_processor.py <pdf_file>")
+        print("Usage: python document_processor.py <document_file>")
         return
 
     file_path = sys.argv[1]
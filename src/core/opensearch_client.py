@@ -1,7 +1,9 @@
 from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
 from opensearchpy import OpenSearch, helpers
 from tqdm import tqdm
 from ..config import load_config
+from .bedrock_scheduler import get_scheduler, PRIORITY_INTERACTIVE
 
 class OpenSearchHandler:
     def __init__(self):
@@ -82,6 +84,19 @@ class OpenSearchHandler:
                             "type": "text",
                             "analyzer": "nori_analyzer"
                         },
+                        "source": {
+                            "type": "keyword"
+                        },
+                        "page": {
+                            "type": "integer"
+                        },
+                        "section": {
+                            "type": "integer"
+                        },
+                        "title": {
+                            "type": "text",
+                            "analyzer": "nori_analyzer"
+                        },
                         "content_vector": {
                             "type": "knn_vector",
                             "dimension": self.embedding_dim,
@@ -129,23 +144,48 @@ class OpenSearchHandler:
                 print(f"Error creating search pipeline: {str(e)}")
 
     def index_documents(self,
-                        chunks: List[str],
+                        chunks: List[Dict],
                         raw_text: str,
                         context_generator,
                         embedding_model) -> None:
-        docs = []
-        for i, chunk in enumerate(tqdm(chunks, desc="Processing chunks")):
-            context = context_generator.generate_context(raw_text, chunk)
-            combined_text = f"내용: {chunk}\n맥락: {context}"
+        def build_doc(item):
+            i, chunk = item
+            text = chunk["text"]
+            metadata = chunk.get("metadata", {})
+            context = context_generator.generate_context(raw_text, text, start_pos=metadata.get("start_pos"))
+            combined_text = f"내용: {text}\n맥락: {context}"
             embedding = embedding_model.encode_single(combined_text)
-            doc = {
+            return {
                 "_index": self.index_name,
                 "_id": str(i),
-                "content": chunk.strip(),
+                "content": text.strip(),
                 "context": context.strip(),
+                "source": metadata.get("source"),
+                "page": metadata.get("page"),
+                "section": metadata.get("section"),
+                "title": metadata.get("title"),
                 "content_vector": embedding.tolist()
             }
-            docs.append(doc)
+
+        # Bedrock calls are paced by the shared scheduler, so workers only
+        # keep enough requests in flight to use the available quota
+        scheduler = get_scheduler()
+        docs = []
+        executor = ThreadPoolExecutor(max_workers=scheduler.max_concurrency)
+        try:
+            futures = [executor.submit(build_doc, item) for item in enumerate(chunks)]
+            progress = tqdm(futures, total=len(chunks), desc="Processing chunks")
+            for future in progress:
+                docs.append(future.result())
+                stats = scheduler.stats()
+                progress.set_postfix(queued=sum(stats["queue_depth"].values()),
+                                     avg_wait=f"{stats['avg_wait']:.2f}s",
+                                     retries=stats["retries"])
+        except BaseException:
+            # Stop queued chunks from spending Bedrock quota on a failed run
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
 
         for i in range(0, len(docs), self.bulk_size):
             chunk_docs = docs[i:i + self.bulk_size]
@@ -156,7 +196,7 @@ class OpenSearchHandler:
 
     def search(self, query: str, embedding_model, k: int = 5) -> List[Dict]:
         combined_query = f"질문: {query}\n맥락: {query}"
-        query_vector = embedding_model.encode_single(combined_query).tolist()
+        query_vector = embedding_model.encode_single(combined_query, PRIORITY_INTERACTIVE).tolist()
 
         search_body = {
             "size": k,
@@ -197,6 +237,8 @@ class OpenSearchHandler:
             results.append({
                 'content': hit['_source']['content'],
                 'context': hit['_source']['context'],
+                'source': hit['_source'].get('source'),
+                'page': hit['_source'].get('page'),
                 'score': hit['_score']
             })
         return results